@@ -47,6 +47,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "shop.middleware.ReplicaPinningMiddleware",
 ]
 
 # URL 설정 파일 경로
@@ -80,6 +81,60 @@ DATABASES = {
     }
 }
 
+# 읽기 전용 레플리카 설정 (DB_REPLICAS 환경 변수에 SQLite 파일 경로를 콤마로 구분)
+DATABASE_REPLICAS = []
+_replica_paths = [path for path in os.environ.get("DB_REPLICAS", "").split(",") if path]
+for _index, _replica_path in enumerate(_replica_paths, start=1):
+    _alias = f"replica{_index}"
+    DATABASES[_alias] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": _replica_path,
+        # 테스트에서는 프라이머리 DB를 그대로 사용
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(_alias)
+
+# DB 라우터 설정
+DATABASE_ROUTERS = ["shop.db_router.PrimaryReplicaRouter"]
+
+# 쓰기 이후 읽기를 프라이머리로 고정하는 쿠키 설정
+REPLICA_PIN_COOKIE_NAME = "pin_primary"
+REPLICA_PIN_SECONDS = 5
+
+# 캐시 설정
+# LocMemCache 는 프로세스별 캐시라 상품 통계 무효화가 다른 워커에 전달되지 않음
+# (archive_products 등 관리 명령의 무효화도 웹 워커에 전달되지 않으며,
+# 다른 프로세스는 최대 PRODUCT_STATS_CACHE_TIMEOUT 동안 이전 통계 응답)
+# 워커가 여러 개인 환경에서는 Redis/Memcached 등 공유 캐시로 교체
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# 상품 통계 캐시 유지 시간(초) 및 가격 구간 크기
+PRODUCT_STATS_CACHE_TIMEOUT = 60
+PRODUCT_STATS_PRICE_BUCKET_SIZE = 10000
+
+# 상품 검색 결과 최대 개수
+PRODUCT_SEARCH_LIMIT = 20
+# 상품 검색어 최대 길이
+PRODUCT_SEARCH_MAX_QUERY_LENGTH = 50
+# 상품 검색 시 가장 드문 토큰에서 뽑는 후보 상품 최대 개수
+PRODUCT_SEARCH_CANDIDATE_LIMIT = 1000
+
+# 상품 일괄 조회(?ids=) 최대 개수
+PRODUCT_BATCH_GET_LIMIT = 100
+
+# Idempotency-Key 보관 기간(초)
+IDEMPOTENCY_KEY_TTL = 60 * 60 * 24
+
+# 요청 프로파일 설정 (관리자 X-Profile 헤더 또는 샘플링 비율)
+PROFILING_SAMPLE_RATE = float(os.environ.get("PROFILING_SAMPLE_RATE", 0))
+PROFILING_DIR = os.path.join(BASE_DIR, "profiles")
+# 보관할 최대 프로파일 수 (초과 시 오래된 것부터 삭제)
+PROFILING_MAX_CAPTURES = 200
+
 # 비밀번호 유효성 검사 설정
 AUTH_PASSWORD_VALIDATORS = [
     {
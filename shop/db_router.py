@@ -0,0 +1,70 @@
+import random
+import threading
+
+from django.conf import settings
+
+__all__ = (
+    "PRIMARY_DB_ALIAS",
+    "PrimaryReplicaRouter",
+    "pin_primary",
+    "unpin_primary",
+    "is_primary_pinned",
+    "reset_replica",
+)
+
+PRIMARY_DB_ALIAS = "default"
+
+# 요청 단위로 프라이머리 고정 여부를 저장 (스레드별)
+_local = threading.local()
+
+
+def pin_primary():
+    """현재 스레드의 읽기 쿼리를 프라이머리로 고정"""
+    _local.pinned = True
+
+
+def unpin_primary():
+    """프라이머리 고정 해제"""
+    _local.pinned = False
+
+
+def is_primary_pinned():
+    return getattr(_local, "pinned", False)
+
+
+def reset_replica():
+    """요청 종료 시 선택된 레플리카 초기화 (다음 요청에서 다시 선택)"""
+    _local.replica = None
+
+
+def _current_replica(replicas):
+    """요청 단위로 하나의 레플리카를 고정해 같은 요청의 쿼리가 같은 스냅샷을 보도록 함"""
+    replica = getattr(_local, "replica", None)
+    if replica not in replicas:
+        replica = _local.replica = random.choice(replicas)
+    return replica
+
+
+class PrimaryReplicaRouter:
+    """읽기는 레플리카, 쓰기는 프라이머리로 보내는 DB 라우터"""
+
+    def db_for_read(self, model, **hints):
+        # 연관 객체 조회는 원본 객체를 읽은 DB를 그대로 사용
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db:
+            return instance._state.db
+
+        replicas = getattr(settings, "DATABASE_REPLICAS", [])
+        if not replicas or is_primary_pinned():
+            return PRIMARY_DB_ALIAS
+        return _current_replica(replicas)
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 프라이머리와 레플리카는 같은 데이터를 가지므로 관계 허용
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return True
@@ -0,0 +1,113 @@
+"""Idempotency-Key 헤더 기반 쓰기 요청 중복 방지
+
+키는 인증된 사용자별로 구분됨. 익명 요청(AllowAny)의 키는 모든 익명 클라이언트가
+공유하므로, 다른 단말이 같은 키와 같은 본문으로 요청하면 먼저 저장된 응답을 받음.
+익명 단말은 추측할 수 없는 키(UUID 등)를 사용해야 함.
+"""
+
+import functools
+import hashlib
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+from shop.models import IdempotencyKey
+
+__all__ = (
+    "IDEMPOTENCY_KEY_HEADER",
+    "idempotent",
+)
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+
+def _fingerprint(request):
+    """요청 메서드, 경로, 본문으로 만든 요청 지문"""
+    payload = json.dumps(request.data, sort_keys=True, cls=DjangoJSONEncoder)
+    raw = f"{request.method}\n{request.path}\n{payload}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _scope(request):
+    """키 범위 (인증된 사용자별, 익명 요청은 공용 범위)"""
+    user = request.user
+    if user and user.is_authenticated:
+        return f"user:{user.pk}"
+    return ""
+
+
+def _reserve(scope, key, fingerprint):
+    """키 선점 (record, None), 이미 사용된 키면 (None, 기존 record)
+
+    보관 기간이 지난 키는 정리 명령을 기다리지 않고 삭제 후 다시 선점
+    """
+    expired_before = timezone.now() - timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL)
+    while True:
+        try:
+            with transaction.atomic():
+                record = IdempotencyKey.objects.create(
+                    scope=scope, key=key, fingerprint=fingerprint
+                )
+            return record, None
+        except IntegrityError:
+            existing = IdempotencyKey.objects.get(scope=scope, key=key)
+            if existing.created_at >= expired_before:
+                return None, existing
+            existing.delete()
+
+
+def _replay(record, fingerprint):
+    """저장된 응답 재전송 (다른 요청에 사용된 키는 거부)"""
+    if record.fingerprint != fingerprint:
+        return Response(
+            {"message": "다른 요청에 이미 사용된 Idempotency-Key입니다."},
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+
+    response = Response(json.loads(record.response_body), status=record.status_code)
+    response["Idempotent-Replayed"] = "true"
+    return response
+
+
+def idempotent(view_method):
+    """Idempotency-Key 헤더가 있는 쓰기 요청을 한 번만 처리하는 데코레이터"""
+
+    @functools.wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+        if not key:
+            return view_method(self, request, *args, **kwargs)
+
+        # 키 길이 검증
+        if len(key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+            return Response(
+                {"message": "Idempotency-Key가 너무 깁니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        fingerprint = _fingerprint(request)
+
+        # 키 선점과 쓰기를 한 트랜잭션으로 처리
+        # (동시에 들어온 중복 요청은 unique 제약에서 대기 후 저장된 응답을 받음)
+        with transaction.atomic():
+            record, existing = _reserve(_scope(request), key, fingerprint)
+            if existing is not None:
+                return _replay(existing, fingerprint)
+
+            response = view_method(self, request, *args, **kwargs)
+
+            # 응답 저장
+            record.status_code = response.status_code
+            record.response_body = json.dumps(response.data, cls=DjangoJSONEncoder)
+            record.save(update_fields=["status_code", "response_body"])
+
+        return response
+
+    return wrapper
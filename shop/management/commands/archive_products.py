@@ -0,0 +1,106 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from shop.db_router import pin_primary, unpin_primary
+from shop.models import ArchivedProduct, ArchivedProductOption, Product, ProductOption
+from shop.stats import invalidate_product_stats
+
+
+class Command(BaseCommand):
+    help = "오래 보관된 상품과 옵션을 아카이브 테이블로 이동합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=90,
+            help="보관 처리 후 이동까지의 기간(일)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="한 번에 이동할 상품 수",
+        )
+
+    def handle(self, *args, **options):
+        # 복사/삭제는 프라이머리에서 하므로 읽기도 프라이머리에서 처리
+        # (레플리카에서 읽으면 이미 이동한 상품이나 지연된 옵션/태그를 다시 읽을 수 있음)
+        pin_primary()
+        try:
+            moved = self._archive(options["days"], options["batch_size"])
+        finally:
+            unpin_primary()
+
+        # 이동한 상품이 있으면 통계 캐시 무효화
+        # (명령은 별도 프로세스로 실행되므로 공유 캐시(Redis/Memcached 등)일 때만
+        # 웹 워커에 전달됨. LocMemCache 에서는 워커마다 최대
+        # PRODUCT_STATS_CACHE_TIMEOUT 동안 이전 통계를 응답)
+        if moved:
+            invalidate_product_stats()
+
+        self.stdout.write(f"{moved}개 상품을 아카이브 테이블로 이동했습니다.")
+
+    def _archive(self, days, batch_size):
+        """배치 단위로 이동하고 이동한 상품 수 반환"""
+        archived_before = timezone.now() - timedelta(days=days)
+        moved = 0
+
+        # 배치마다 트랜잭션으로 복사 후 삭제
+        while True:
+            with transaction.atomic():
+                products = list(
+                    Product.objects.filter(
+                        is_active=False, archived_at__lt=archived_before
+                    )
+                    .order_by("archived_at", "id")
+                    .prefetch_related("tag_set")[:batch_size]
+                )
+                if not products:
+                    break
+                self._move(products)
+
+            moved += len(products)
+
+        return moved
+
+    def _move(self, products):
+        """상품/옵션/태그 연결을 아카이브 테이블에 복사하고 원본 삭제"""
+        product_ids = [product.pk for product in products]
+
+        ArchivedProduct.objects.bulk_create(
+            [
+                ArchivedProduct(
+                    id=product.pk,
+                    name=product.name,
+                    archived_at=product.archived_at,
+                )
+                for product in products
+            ]
+        )
+        ArchivedProductOption.objects.bulk_create(
+            [
+                ArchivedProductOption(
+                    id=option.pk,
+                    product_id=option.product_id,
+                    name=option.name,
+                    price=option.price,
+                )
+                for option in ProductOption.objects.filter(product_id__in=product_ids)
+            ]
+        )
+        ArchivedProduct.tag_set.through.objects.bulk_create(
+            [
+                ArchivedProduct.tag_set.through(
+                    archivedproduct_id=product.pk, tag_id=tag.pk
+                )
+                for product in products
+                for tag in product.tag_set.all()
+            ]
+        )
+
+        # 원본 삭제 (옵션, 태그 연결, 검색 토큰은 함께 삭제)
+        Product.objects.filter(pk__in=product_ids).delete()
@@ -0,0 +1,21 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from shop.models import IdempotencyKey
+
+
+class Command(BaseCommand):
+    help = "보관 기간이 지난 Idempotency-Key를 삭제합니다."
+
+    def handle(self, *args, **options):
+        expired_before = timezone.now() - timedelta(
+            seconds=settings.IDEMPOTENCY_KEY_TTL
+        )
+        deleted, _ = IdempotencyKey.objects.filter(
+            created_at__lt=expired_before
+        ).delete()
+
+        self.stdout.write(f"{deleted}개의 Idempotency-Key를 삭제했습니다.")
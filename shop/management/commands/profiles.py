@@ -0,0 +1,74 @@
+import glob
+import io
+import json
+import os
+import pstats
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "저장된 요청 프로파일 목록을 보거나 하나를 요약합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("profile_id", nargs="?", help="요약할 프로파일 id")
+        parser.add_argument(
+            "--limit", type=int, default=20, help="목록에 표시할 프로파일 수"
+        )
+        parser.add_argument(
+            "--top", type=int, default=20, help="요약에 표시할 함수/SQL 수"
+        )
+
+    def handle(self, *args, **options):
+        if options["profile_id"]:
+            self._summarize(options["profile_id"], options["top"])
+        else:
+            self._list(options["limit"])
+
+    def _list(self, limit):
+        """최신 프로파일부터 목록 출력"""
+        paths = sorted(
+            glob.glob(os.path.join(settings.PROFILING_DIR, "*.json")), reverse=True
+        )
+        if not paths:
+            self.stdout.write("저장된 프로파일이 없습니다.")
+            return
+
+        for path in paths[:limit]:
+            with open(path) as f:
+                summary = json.load(f)
+            self.stdout.write(
+                f"{summary['id']}  {summary['method']} {summary['path']}  "
+                f"{summary['status_code']}  {summary['duration_ms']:.1f}ms  "
+                f"SQL {summary['sql_count']}건 {summary['sql_duration_ms']:.1f}ms"
+            )
+
+    def _summarize(self, profile_id, top):
+        """느린 SQL과 누적 시간 상위 함수 출력"""
+        base_path = os.path.join(settings.PROFILING_DIR, profile_id)
+        if not os.path.exists(f"{base_path}.json"):
+            raise CommandError(f"프로파일을 찾을 수 없습니다: {profile_id}")
+
+        with open(f"{base_path}.json") as f:
+            summary = json.load(f)
+
+        self.stdout.write(
+            f"{summary['method']} {summary['path']} ({summary['action']}) "
+            f"{summary['status_code']}  {summary['duration_ms']:.1f}ms"
+        )
+        self.stdout.write(
+            f"SQL {summary['sql_count']}건 {summary['sql_duration_ms']:.1f}ms"
+        )
+        queries = sorted(
+            summary["queries"], key=lambda query: query["duration_ms"], reverse=True
+        )
+        for query in queries[:top]:
+            self.stdout.write(f"  {query['duration_ms']:8.2f}ms  {query['sql']}")
+
+        # Python 프로파일 (누적 시간 기준)
+        # (OutputWrapper 는 write 마다 줄바꿈을 붙이므로 버퍼에 모아 한 번에 출력)
+        buffer = io.StringIO()
+        stats = pstats.Stats(f"{base_path}.prof", stream=buffer)
+        stats.sort_stats("cumulative").print_stats(top)
+        self.stdout.write(buffer.getvalue(), ending="")
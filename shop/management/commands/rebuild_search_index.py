@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from shop.db_router import pin_primary, unpin_primary
+from shop.models import Product
+from shop.search import index_product
+
+
+class Command(BaseCommand):
+    help = "상품 검색 색인을 다시 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 처리할 상품 수",
+        )
+
+    def handle(self, *args, **options):
+        # 삭제/생성은 프라이머리에서 하므로 읽기도 프라이머리에서 처리
+        pin_primary()
+        try:
+            self._rebuild(options["batch_size"])
+        finally:
+            unpin_primary()
+
+    def _rebuild(self, batch_size):
+        last_pk = 0
+        indexed = 0
+
+        # pk 순서로 배치 단위 색인
+        while True:
+            products = list(
+                Product.objects.for_api().filter(pk__gt=last_pk)[:batch_size]
+            )
+            if not products:
+                break
+
+            with transaction.atomic():
+                for product in products:
+                    index_product(
+                        product, [option.name for option in product.option_set.all()]
+                    )
+
+            last_pk = products[-1].pk
+            indexed += len(products)
+
+        self.stdout.write(f"{indexed}개 상품의 검색 색인을 생성했습니다.")
@@ -0,0 +1,38 @@
+from django.conf import settings
+
+from shop.db_router import pin_primary, reset_replica, unpin_primary
+
+__all__ = ("ReplicaPinningMiddleware",)
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class ReplicaPinningMiddleware:
+    """쓰기 직후 클라이언트의 읽기를 잠시 프라이머리로 고정 (read-your-writes)"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        cookie_name = settings.REPLICA_PIN_COOKIE_NAME
+        is_write = request.method not in SAFE_METHODS
+
+        # 쓰기 요청이거나 최근에 쓰기를 한 클라이언트는 프라이머리에서 읽기
+        if is_write or cookie_name in request.COOKIES:
+            pin_primary()
+
+        try:
+            response = self.get_response(request)
+        finally:
+            unpin_primary()
+            reset_replica()
+
+        # 쓰기 요청 이후 복제 지연 동안 프라이머리 고정 쿠키 발급
+        if is_write:
+            response.set_cookie(
+                cookie_name,
+                "1",
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+            )
+        return response
@@ -1,10 +1,16 @@
 # shop/models.py
 from django.db import models
+from django.db.models import Prefetch, Q
 
 __all__ = (
     "Tag",
+    "ProductQuerySet",
     "Product",
     "ProductOption",
+    "ProductSearchToken",
+    "IdempotencyKey",
+    "ArchivedProduct",
+    "ArchivedProductOption",
 )
 
 
@@ -15,9 +21,60 @@ class Tag(models.Model):
         return self.name
 
 
+class ProductQuerySet(models.QuerySet):
+    """상품 API 조회용 QuerySet"""
+
+    def api_prefetches(self):
+        """직렬화에 필요한 컬럼만 조회하는 연관 객체 Prefetch 목록"""
+        return [
+            Prefetch(
+                "option_set",
+                queryset=ProductOption.objects.only(
+                    "id", "product", "name", "price"
+                ).order_by("id"),
+            ),
+            Prefetch(
+                "tag_set",
+                queryset=Tag.objects.only("id", "name").order_by("id"),
+            ),
+        ]
+
+    def active(self):
+        """보관 처리되지 않은 상품"""
+        return self.filter(is_active=True)
+
+    def for_api(self):
+        """API 응답용 상품 목록 (상품 1회 + 옵션 1회 + 태그 1회 쿼리)"""
+        return (
+            self.only("id", "name", "is_active")
+            .order_by("id")
+            .prefetch_related(*self.api_prefetches())
+        )
+
+
 class Product(models.Model):
     name = models.CharField("상품명", max_length=100)
     tag_set = models.ManyToManyField(Tag, blank=True)
+    is_active = models.BooleanField("판매 여부", default=True)
+    archived_at = models.DateTimeField("보관일시", null=True, blank=True)
+
+    objects = ProductQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # 판매 중인 상품만 담는 부분 인덱스 (목록 조회)
+            models.Index(
+                fields=["id"],
+                name="product_active_idx",
+                condition=Q(is_active=True),
+            ),
+            # 보관된 상품만 담는 부분 인덱스 (아카이브 이동)
+            models.Index(
+                fields=["archived_at"],
+                name="product_archived_idx",
+                condition=Q(is_active=False),
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -36,3 +93,73 @@ class ProductOption(models.Model):
 
     def __str__(self):
         return self.name
+
+
+class ProductSearchToken(models.Model):
+    """상품명/옵션명 n-gram 역색인"""
+
+    product = models.ForeignKey(
+        Product,
+        verbose_name="상품",
+        related_name="search_token_set",
+        on_delete=models.CASCADE,
+    )
+    token = models.CharField("토큰", max_length=2)
+    weight = models.PositiveSmallIntegerField("가중치")
+
+    class Meta:
+        unique_together = [("product", "token")]
+        # 토큰별 색인 개수 계산과 가중치 순 후보 조회에 사용
+        indexes = [models.Index(fields=["token", "weight", "product"])]
+
+    def __str__(self):
+        return self.token
+
+
+class IdempotencyKey(models.Model):
+    """Idempotency-Key 요청 지문과 저장된 응답"""
+
+    scope = models.CharField("키 범위", max_length=64, blank=True)
+    key = models.CharField("멱등성 키", max_length=255)
+    fingerprint = models.CharField("요청 지문", max_length=64)
+    status_code = models.PositiveSmallIntegerField("응답 코드", null=True)
+    response_body = models.TextField("응답 본문", blank=True)
+    created_at = models.DateTimeField("생성일시", auto_now_add=True, db_index=True)
+
+    class Meta:
+        unique_together = [("scope", "key")]
+
+    def __str__(self):
+        return self.key
+
+
+class ArchivedProduct(models.Model):
+    """아카이브 테이블로 이동된 상품 (원본 pk 유지)"""
+
+    id = models.IntegerField(primary_key=True)
+    name = models.CharField("상품명", max_length=100)
+    tag_set = models.ManyToManyField(
+        Tag, blank=True, related_name="archived_product_set"
+    )
+    archived_at = models.DateTimeField("보관일시")
+    moved_at = models.DateTimeField("이동일시", auto_now_add=True)
+
+    def __str__(self):
+        return self.name
+
+
+class ArchivedProductOption(models.Model):
+    """아카이브 테이블로 이동된 상품 옵션 (원본 pk 유지)"""
+
+    id = models.IntegerField(primary_key=True)
+    product = models.ForeignKey(
+        ArchivedProduct,
+        verbose_name="상품",
+        related_name="option_set",
+        on_delete=models.CASCADE,
+    )
+    name = models.CharField("옵션명", max_length=100)
+    price = models.IntegerField("가격")
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,118 @@
+import cProfile
+import glob
+import json
+import os
+import random
+import time
+import uuid
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+__all__ = (
+    "PROFILE_HEADER",
+    "ProfilingMixin",
+    "should_profile",
+)
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+
+def should_profile(request):
+    """관리자 헤더 요청이거나 샘플링에 당첨된 요청인지 확인"""
+    if PROFILE_HEADER in request.headers:
+        user = getattr(request, "user", None)
+        if user is not None and user.is_staff:
+            return True
+
+    rate = settings.PROFILING_SAMPLE_RATE
+    return rate > 0 and random.random() < rate
+
+
+class _QueryRecorder:
+    """실행된 SQL과 소요 시간을 기록하는 DB execute wrapper"""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append(
+                {
+                    "alias": context["connection"].alias,
+                    "sql": sql,
+                    "duration_ms": (time.perf_counter() - start) * 1000,
+                }
+            )
+
+
+class ProfilingMixin:
+    """ViewSet 요청을 cProfile과 SQL 기록으로 감싸는 mixin (꺼져 있으면 추가 비용 없음)"""
+
+    def dispatch(self, request, *args, **kwargs):
+        if not should_profile(request):
+            return super().dispatch(request, *args, **kwargs)
+
+        profiler = cProfile.Profile()
+        recorder = _QueryRecorder()
+        start = time.perf_counter()
+
+        # 모든 DB 연결의 SQL 기록 + Python 프로파일
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            profiler.enable()
+            try:
+                response = super().dispatch(request, *args, **kwargs)
+            finally:
+                profiler.disable()
+
+        duration_ms = (time.perf_counter() - start) * 1000
+        profile_id = self._save_profile(
+            request, response, profiler, recorder.queries, duration_ms
+        )
+        response[PROFILE_ID_HEADER] = profile_id
+        return response
+
+    def _save_profile(self, request, response, profiler, queries, duration_ms):
+        """snakeviz 등에서 열 수 있는 .prof 파일과 요청/SQL 요약 .json 파일 저장"""
+        profile_dir = settings.PROFILING_DIR
+        os.makedirs(profile_dir, exist_ok=True)
+
+        now = timezone.now()
+        profile_id = f"{now:%Y%m%d-%H%M%S-%f}-{uuid.uuid4().hex[:8]}"
+        profiler.dump_stats(os.path.join(profile_dir, f"{profile_id}.prof"))
+
+        summary = {
+            "id": profile_id,
+            "created_at": now.isoformat(),
+            "method": request.method,
+            "path": request.get_full_path(),
+            "action": getattr(self, "action", None),
+            "status_code": response.status_code,
+            "duration_ms": duration_ms,
+            "sql_count": len(queries),
+            "sql_duration_ms": sum(query["duration_ms"] for query in queries),
+            "queries": queries,
+        }
+        with open(os.path.join(profile_dir, f"{profile_id}.json"), "w") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+        _prune_profiles(profile_dir, settings.PROFILING_MAX_CAPTURES)
+        return profile_id
+
+
+def _prune_profiles(profile_dir, max_captures):
+    """최근 max_captures 개만 남기고 오래된 프로파일 삭제 (id가 시각 순이므로 이름순 정렬)"""
+    summaries = sorted(glob.glob(os.path.join(profile_dir, "*.json")))
+    for summary_path in summaries[: max(len(summaries) - max_captures, 0)]:
+        base_path = summary_path[: -len(".json")]
+        for path in (summary_path, f"{base_path}.prof"):
+            if os.path.exists(path):
+                os.remove(path)
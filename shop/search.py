@@ -0,0 +1,106 @@
+from django.conf import settings
+from django.db.models import Count, Sum
+
+from shop.models import Product, ProductSearchToken
+
+__all__ = (
+    "tokenize",
+    "index_product",
+    "search_products",
+)
+
+# 상품명 토큰이 옵션명 토큰보다 높은 순위를 갖도록 가중치 부여
+NAME_WEIGHT = 2
+OPTION_WEIGHT = 1
+
+
+def tokenize(text):
+    """단어별 1-gram, 2-gram 토큰 집합 (한글 음절 단위 부분 검색 지원)"""
+    tokens = set()
+    for word in text.lower().split():
+        tokens.update(word)
+        tokens.update(word[i : i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def _query_tokens(query):
+    """검색어 토큰 (2글자 이상 단어는 2-gram, 1글자 단어는 1-gram)"""
+    tokens = set()
+    for word in query.lower().split():
+        if len(word) == 1:
+            tokens.add(word)
+        else:
+            tokens.update(word[i : i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def index_product(product, option_names):
+    """상품의 검색 토큰을 다시 생성 (보관된 상품은 토큰만 삭제)"""
+    ProductSearchToken.objects.filter(product=product).delete()
+    if not product.is_active:
+        return
+
+    weights = {}
+    for name in option_names:
+        for token in tokenize(name):
+            weights[token] = OPTION_WEIGHT
+    for token in tokenize(product.name):
+        weights[token] = NAME_WEIGHT
+
+    ProductSearchToken.objects.bulk_create(
+        [
+            ProductSearchToken(product=product, token=token, weight=weight)
+            for token, weight in weights.items()
+        ]
+    )
+
+
+def _posting_count(token, cap):
+    """토큰의 색인 개수 (cap 까지만 세어 흔한 토큰도 비용이 일정)"""
+    return ProductSearchToken.objects.filter(token=token)[:cap].count()
+
+
+def search_products(query, limit=None):
+    """검색어 토큰을 모두 포함하는 상품을 점수 순으로 반환
+
+    가장 드문 토큰의 색인에서 가중치 순으로 최대 PRODUCT_SEARCH_CANDIDATE_LIMIT 개의
+    후보 상품만 뽑은 뒤 나머지 토큰으로 거르므로, 흔한 음절(예: "스") 검색도
+    카탈로그 크기와 무관하게 일정한 양의 색인만 읽음
+    (후보 한도를 넘는 흔한 검색어는 후보 밖의 상품이 결과에서 빠질 수 있음)
+    """
+    tokens = _query_tokens(query)
+    if not tokens:
+        return []
+    if limit is None:
+        limit = settings.PRODUCT_SEARCH_LIMIT
+    candidate_limit = settings.PRODUCT_SEARCH_CANDIDATE_LIMIT
+
+    # 가장 드문 토큰 선택 (일치하는 색인이 없는 토큰이 있으면 결과 없음)
+    counts = {}
+    for token in sorted(tokens):
+        counts[token] = _posting_count(token, candidate_limit)
+        if not counts[token]:
+            return []
+    # 후보 한도에 걸려 개수가 같으면 더 긴(선택도가 높은) 토큰, 그다음 문자열 순으로 선택
+    rarest = min(counts, key=lambda token: (counts[token], -len(token), token))
+
+    # 드문 토큰의 후보 상품 (token, weight, product 인덱스 역순 스캔)
+    candidate_ids = (
+        ProductSearchToken.objects.filter(token=rarest)
+        .order_by("-weight", "-product")
+        .values("product")[:candidate_limit]
+    )
+
+    # 후보 중 모든 토큰이 일치하는 상품만 가중치 합계 순으로 정렬
+    ranked_ids = list(
+        ProductSearchToken.objects.filter(token__in=tokens, product__in=candidate_ids)
+        .values("product")
+        .annotate(matched=Count("id"), score=Sum("weight"))
+        .filter(matched=len(tokens))
+        .order_by("-score", "product")
+        .values_list("product", flat=True)[:limit]
+    )
+
+    # 순위 순서대로 상품 정렬 (색인 이후 삭제된 상품은 제외)
+    products = Product.objects.for_api().in_bulk(ranked_ids)
+    return [products[pk] for pk in ranked_ids if pk in products]
@@ -21,4 +21,4 @@ class ProductCreateSerializer(WritableNestedModelSerializer):
 
     class Meta:
         model = Product
-        fields = ["pk", "name", "option_set", "tag_set"]
+        fields = ["pk", "name", "is_active", "option_set", "tag_set"]
@@ -0,0 +1,140 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import (
+    Avg,
+    Count,
+    ExpressionWrapper,
+    F,
+    IntegerField,
+    Max,
+    Min,
+    OuterRef,
+    Q,
+    Subquery,
+)
+from django.db.models.functions import Coalesce
+
+from shop.db_router import PRIMARY_DB_ALIAS
+from shop.models import Product, ProductOption, Tag
+
+__all__ = (
+    "PRODUCT_STATS_CACHE_KEY",
+    "product_stats_cache_key",
+    "get_product_stats",
+    "invalidate_product_stats",
+)
+
+PRODUCT_STATS_CACHE_KEY = "shop:product-stats"
+PRODUCT_STATS_GENERATION_KEY = "shop:product-stats:generation"
+
+
+def _tag_product_counts():
+    """태그별 판매 중인 상품 수 (상품 연결 테이블 기준 집계)"""
+    return list(
+        Tag.objects.using(PRIMARY_DB_ALIAS)
+        .annotate(product_count=Count("product", filter=Q(product__is_active=True)))
+        .order_by("-product_count", "id")
+        .values("id", "name", "product_count")
+    )
+
+
+def _price_distribution():
+    """판매 중인 상품 옵션의 가격 요약 및 구간별 옵션 수"""
+    bucket_size = settings.PRODUCT_STATS_PRICE_BUCKET_SIZE
+    options = ProductOption.objects.using(PRIMARY_DB_ALIAS).filter(
+        product__is_active=True
+    )
+    summary = options.aggregate(min=Min("price"), max=Max("price"), avg=Avg("price"))
+
+    buckets = (
+        options.annotate(
+            bucket=ExpressionWrapper(
+                F("price") / bucket_size, output_field=IntegerField()
+            )
+        )
+        .values("bucket")
+        .annotate(option_count=Count("id"))
+        .order_by("bucket")
+    )
+    summary["buckets"] = [
+        {
+            "min_price": row["bucket"] * bucket_size,
+            "max_price": (row["bucket"] + 1) * bucket_size - 1,
+            "option_count": row["option_count"],
+        }
+        for row in buckets
+    ]
+    return summary
+
+
+def _option_count_histogram():
+    """옵션 개수별 판매 중인 상품 수"""
+    option_counts = (
+        ProductOption.objects.filter(product=OuterRef("pk"))
+        .order_by()
+        .values("product")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    rows = (
+        Product.objects.using(PRIMARY_DB_ALIAS)
+        .active()
+        .annotate(
+            option_count=Coalesce(
+                Subquery(option_counts, output_field=IntegerField()), 0
+            )
+        )
+        .values("option_count")
+        .annotate(product_count=Count("id"))
+        .order_by("option_count")
+    )
+    return [
+        {"option_count": row["option_count"], "product_count": row["product_count"]}
+        for row in rows
+    ]
+
+
+def _compute_product_stats():
+    # 보관된 상품은 제외하고 판매 중인 카탈로그만 집계
+    # 쓰기 직후 무효화된 캐시를 복제 지연된 레플리카 데이터로 다시 채우지 않도록 프라이머리에서 집계
+    return {
+        "product_count": Product.objects.using(PRIMARY_DB_ALIAS).active().count(),
+        "option_count": ProductOption.objects.using(PRIMARY_DB_ALIAS)
+        .filter(product__is_active=True)
+        .count(),
+        "tag_product_counts": _tag_product_counts(),
+        "price": _price_distribution(),
+        "option_count_histogram": _option_count_histogram(),
+    }
+
+
+def product_stats_cache_key():
+    """현재 세대의 통계 캐시 키
+
+    무효화 시 세대를 올리므로, 쓰기 커밋 전에 집계를 시작한 요청이 늦게 저장해도
+    이전 세대 키에 저장되어 새 세대의 통계를 덮어쓰지 않음
+    """
+    generation = cache.get(PRODUCT_STATS_GENERATION_KEY)
+    if generation is None:
+        cache.add(PRODUCT_STATS_GENERATION_KEY, 0, None)
+        generation = cache.get(PRODUCT_STATS_GENERATION_KEY, 0)
+    return f"{PRODUCT_STATS_CACHE_KEY}:{generation}"
+
+
+def get_product_stats():
+    """캐시된 상품 통계 반환 (캐시가 없으면 DB 집계 후 저장)"""
+    cache_key = product_stats_cache_key()
+    stats = cache.get(cache_key)
+    if stats is None:
+        stats = _compute_product_stats()
+        cache.set(cache_key, stats, settings.PRODUCT_STATS_CACHE_TIMEOUT)
+    return stats
+
+
+def invalidate_product_stats():
+    """상품 데이터 변경 시 통계 캐시 세대 증가"""
+    try:
+        cache.incr(PRODUCT_STATS_GENERATION_KEY)
+    except ValueError:
+        # 세대 키가 없으면(만료/축출) 새 세대로 시작
+        cache.add(PRODUCT_STATS_GENERATION_KEY, 1, None)
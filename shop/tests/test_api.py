@@ -306,3 +306,165 @@ class ProductAPITest(TestCase):
         self.assertIn(
             response.status_code, [status.HTTP_200_OK, status.HTTP_400_BAD_REQUEST]
         )
+
+
+class ProductQueryCountTest(TestCase):
+    """Product API 쿼리 수 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.client = APIClient()
+        self.url = reverse("product-list")
+        self.tag = Tag.objects.create(name="TestTag")
+
+        # 상품 수와 무관하게 쿼리 수가 일정한지 확인하기 위해 여러 상품 생성
+        for index in range(5):
+            self.product = Product.objects.create(name=f"Product{index}")
+            ProductOption.objects.create(
+                product=self.product, name="Option", price=1000
+            )
+            self.product.tag_set.add(self.tag)
+
+        self.detail_url = reverse("product-detail", kwargs={"pk": self.product.pk})
+
+    def test_list_query_count(self):
+        """상품 목록 조회 - 상품/옵션/태그 3회 쿼리"""
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data), 5)
+        self.assertEqual([item["name"] for item in response.data][0], "Product0")
+
+    def test_retrieve_query_count(self):
+        """상품 단일 조회 - 상품/옵션/태그 3회 쿼리"""
+        with self.assertNumQueries(3):
+            response = self.client.get(self.detail_url)
+        self.assertEqual(response.data["tag_set"][0]["name"], "TestTag")
+
+    def test_create_query_count(self):
+        """상품 생성 - 생성 후 재조회 없음"""
+        request_data = {
+            "name": "NewProduct",
+            "option_set": [{"name": "Option", "price": 1000}],
+            "tag_set": [{"pk": self.tag.pk}],
+        }
+
+        # 세이브포인트 2 + 상품 1 + 옵션 1 + 태그 조회 1 + 태그 연결 2 + 검색 색인 2
+        with self.assertNumQueries(9):
+            response = self.client.post(self.url, request_data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["option_set"][0]["name"], "Option")
+        self.assertEqual(response.data["tag_set"][0]["name"], "TestTag")
+
+    def test_create_response_tags_deduplicated(self):
+        """생성 응답의 태그는 중복 제거 후 pk 순 정렬 (목록 조회와 같은 순서)"""
+        other_tag = Tag.objects.create(name="OtherTag")
+        request_data = {
+            "name": "NewProduct",
+            "option_set": [],
+            "tag_set": [
+                {"pk": other_tag.pk},
+                {"pk": self.tag.pk},
+                {"pk": other_tag.pk},
+            ],
+        }
+
+        response = self.client.post(self.url, request_data, format="json")
+        self.assertEqual(
+            [tag["pk"] for tag in response.data["tag_set"]], [self.tag.pk, other_tag.pk]
+        )
+
+    def test_update_query_count(self):
+        """상품 수정 - 수정된 연관 객체는 재조회 없음"""
+        request_data = {
+            "name": "UpdatedProduct",
+            "option_set": [{"name": "UpdatedOption", "price": 2000}],
+            "tag_set": [{"pk": self.tag.pk}],
+        }
+
+        # 상품 조회 1 + 세이브포인트 2 + 수정 1 + 옵션 삭제/생성 2
+        # + 태그 해제/조회/연결 4 + 검색 색인 2
+        with self.assertNumQueries(12):
+            response = self.client.patch(self.detail_url, request_data, format="json")
+        self.assertEqual(response.data["name"], "UpdatedProduct")
+        self.assertEqual(response.data["option_set"][0]["name"], "UpdatedOption")
+
+        # 상품명만 수정하면 옵션/태그만 조회 (+ 검색 색인 2)
+        with self.assertNumQueries(8):
+            response = self.client.patch(
+                self.detail_url, {"name": "OnlyName"}, format="json"
+            )
+        self.assertEqual(response.data["option_set"][0]["price"], 2000)
+        self.assertEqual(response.data["tag_set"][0]["name"], "TestTag")
+
+
+class ProductBatchRetrieveAPITest(TestCase):
+    """상품 일괄 조회 API 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.client = APIClient()
+        self.url = reverse("product-list")
+        self.tag = Tag.objects.create(name="TestTag")
+        self.products = []
+        for index in range(3):
+            product = Product.objects.create(name=f"Product{index}")
+            ProductOption.objects.create(product=product, name="Option", price=1000)
+            product.tag_set.add(self.tag)
+            self.products.append(product)
+
+    def test_batch_retrieve_success(self):
+        """요청 순서 유지 및 누락 상품 보고 테스트"""
+        first, second, third = [product.pk for product in self.products]
+        ids = f"{third},99999,{first},{third}"
+
+        # 상품 수와 무관하게 상품/옵션/태그 3회 쿼리
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url, {"ids": ids})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["pk"] for item in response.data["results"]], [third, first]
+        )
+        self.assertEqual(response.data["results"][0]["tag_set"][0]["name"], "TestTag")
+        self.assertEqual(response.data["missing_ids"], [99999])
+
+    def test_batch_retrieve_validation(self):
+        """일괄 조회 검증 에러 테스트"""
+        # 잘못된 id 형식
+        response = self.client.get(self.url, {"ids": "1,abc"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("잘못된 데이터 형식입니다", response.data["message"])
+
+        # 64비트 범위를 벗어나거나 양수가 아닌 id
+        invalid_ids = [
+            "99999999999999999999999",
+            "9223372036854775808",
+            "0",
+            "-1",
+            "1_000",
+            "١٢",
+        ]
+        for ids in invalid_ids:
+            response = self.client.get(self.url, {"ids": ids})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("잘못된 데이터 형식입니다", response.data["message"])
+
+        # 공백/빈 항목은 개수와 검증에서 제외
+        first, second = self.products[0].pk, self.products[1].pk
+        with self.settings(PRODUCT_BATCH_GET_LIMIT=2):
+            for ids in [
+                f"{first},{second},",
+                f"{first}, ,{second}",
+                f" {first} ,,{second}",
+            ]:
+                response = self.client.get(self.url, {"ids": ids})
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(
+                    [item["pk"] for item in response.data["results"]], [first, second]
+                )
+
+        # 최대 개수 초과 (잘못된 id가 섞여 있어도 개수부터 검증)
+        with self.settings(PRODUCT_BATCH_GET_LIMIT=2):
+            response = self.client.get(self.url, {"ids": "1,2,x"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("최대 2개", response.data["message"])
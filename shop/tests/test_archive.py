@@ -0,0 +1,149 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from shop.models import (
+    Tag,
+    Product,
+    ProductOption,
+    ProductSearchToken,
+    ArchivedProduct,
+)
+from shop.stats import product_stats_cache_key
+
+
+class ProductArchiveAPITest(TestCase):
+    """상품 보관 처리 API 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.client = APIClient()
+        self.url = reverse("product-list")
+        request_data = {
+            "name": "단종상품",
+            "option_set": [{"name": "기본", "price": 1000}],
+            "tag_set": [],
+        }
+        self.product = self.client.post(self.url, request_data, format="json").data
+        self.detail_url = reverse("product-detail", kwargs={"pk": self.product["pk"]})
+        Product.objects.create(name="판매상품")
+
+    def test_archive_hides_product(self):
+        """보관된 상품은 목록/단일/일괄 조회와 검색에서 제외"""
+        response = self.client.patch(
+            self.detail_url, {"is_active": False}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.data["is_active"])
+        self.assertIsNotNone(Product.objects.get(pk=self.product["pk"]).archived_at)
+
+        # 목록/단일/일괄 조회
+        response = self.client.get(self.url)
+        self.assertEqual([item["name"] for item in response.data], ["판매상품"])
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get(self.url, {"ids": str(self.product["pk"])})
+        self.assertEqual(response.data["missing_ids"], [self.product["pk"]])
+
+        # 검색 색인 삭제
+        search_url = reverse("product-search")
+        self.assertEqual(self.client.get(search_url, {"q": "단종"}).data, [])
+
+        # include_archived 사용 시 보관된 상품 포함
+        response = self.client.get(self.url, {"include_archived": "true"})
+        self.assertEqual(len(response.data), 2)
+        response = self.client.get(self.detail_url, {"include_archived": "1"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # 판매 재개 시 다시 조회/검색 가능
+        self.client.patch(self.detail_url, {"is_active": True}, format="json")
+        self.assertIsNone(Product.objects.get(pk=self.product["pk"]).archived_at)
+        self.assertEqual(self.client.get(self.detail_url).status_code, 200)
+        self.assertEqual(len(self.client.get(search_url, {"q": "단종"}).data), 1)
+
+    def test_archive_keeps_archived_at(self):
+        """이미 보관된 상품을 다시 보관 처리해도 보관일시 유지"""
+        archived_at = timezone.now() - timedelta(days=200)
+        Product.objects.filter(pk=self.product["pk"]).update(
+            is_active=False, archived_at=archived_at
+        )
+
+        response = self.client.patch(
+            self.detail_url, {"is_active": False, "name": "이름변경"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        product = Product.objects.get(pk=self.product["pk"])
+        self.assertEqual(product.archived_at, archived_at)
+        self.assertEqual(product.name, "이름변경")
+
+    def test_archive_validation(self):
+        """is_active 형식 오류 테스트"""
+        response = self.client.patch(
+            self.detail_url, {"is_active": "no"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("잘못된 데이터 형식입니다", response.data["message"])
+
+
+class ArchiveProductsCommandTest(TestCase):
+    """아카이브 테이블 이동 명령 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.tag = Tag.objects.create(name="TestTag")
+        self.old = self._archived_product("OldProduct", days=100)
+        self.recent = self._archived_product("RecentProduct", days=10)
+        self.active = Product.objects.create(name="ActiveProduct")
+
+    def _archived_product(self, name, days):
+        """지정한 기간 전에 보관된 상품 생성"""
+        product = Product.objects.create(
+            name=name,
+            is_active=False,
+            archived_at=timezone.now() - timedelta(days=days),
+        )
+        ProductOption.objects.create(product=product, name="Option", price=1000)
+        product.tag_set.add(self.tag)
+        ProductSearchToken.objects.create(product=product, token="ol", weight=2)
+        return product
+
+    def test_archive_products_command(self):
+        """오래 보관된 상품만 옵션/태그와 함께 이동"""
+        cache.set(product_stats_cache_key(), {"product_count": 3})
+
+        # 레플리카가 설정되어도 프라이머리에서 읽음 (레플리카로 라우팅되면 연결 오류)
+        out = StringIO()
+        with self.settings(DATABASE_REPLICAS=["replica1"]):
+            call_command("archive_products", days=90, batch_size=1, stdout=out)
+        self.assertIn("1개 상품", out.getvalue())
+        self.assertIsNone(cache.get(product_stats_cache_key()))
+
+        # 이동할 상품이 없으면 통계 캐시 유지
+        cache.set(product_stats_cache_key(), {"product_count": 2})
+        call_command("archive_products", days=90, stdout=StringIO())
+        self.assertIsNotNone(cache.get(product_stats_cache_key()))
+
+        # 원본 테이블에서 삭제
+        self.assertEqual(
+            set(Product.objects.values_list("name", flat=True)),
+            {"RecentProduct", "ActiveProduct"},
+        )
+        self.assertFalse(ProductOption.objects.filter(product_id=self.old.pk).exists())
+        self.assertFalse(
+            ProductSearchToken.objects.filter(product_id=self.old.pk).exists()
+        )
+
+        # 아카이브 테이블에 원본 pk로 복사
+        archived = ArchivedProduct.objects.get(pk=self.old.pk)
+        self.assertEqual(archived.name, "OldProduct")
+        self.assertEqual(archived.archived_at, self.old.archived_at)
+        self.assertEqual(
+            [option.name for option in archived.option_set.all()], ["Option"]
+        )
+        self.assertEqual(list(archived.tag_set.all()), [self.tag])
@@ -0,0 +1,92 @@
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from shop import db_router
+from shop.db_router import (
+    PrimaryReplicaRouter,
+    is_primary_pinned,
+    pin_primary,
+    reset_replica,
+    unpin_primary,
+)
+from shop.middleware import ReplicaPinningMiddleware
+from shop.models import Product
+
+
+@override_settings(DATABASE_REPLICAS=["replica1", "replica2"])
+class PrimaryReplicaRouterTest(TestCase):
+    """읽기/쓰기 DB 라우터 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.router = PrimaryReplicaRouter()
+        self.factory = RequestFactory()
+
+    def tearDown(self):
+        unpin_primary()
+        reset_replica()
+
+    def _middleware(self, captured):
+        """요청 처리 중 읽기 DB를 기록하는 미들웨어 생성"""
+
+        def get_response(request):
+            captured.append(self.router.db_for_read(Product))
+            return HttpResponse()
+
+        return ReplicaPinningMiddleware(get_response)
+
+    def test_router_read_write(self):
+        """읽기는 레플리카, 쓰기는 프라이머리로 라우팅"""
+        self.assertIn(self.router.db_for_read(Product), ["replica1", "replica2"])
+        self.assertEqual(self.router.db_for_write(Product), "default")
+        self.assertTrue(self.router.allow_relation(Product(), Product()))
+        self.assertTrue(self.router.allow_migrate("replica1", "shop"))
+
+        # 프라이머리 고정 시 읽기도 프라이머리
+        pin_primary()
+        self.assertEqual(self.router.db_for_read(Product), "default")
+
+    def test_router_sticky_replica(self):
+        """같은 요청의 읽기는 하나의 레플리카, 연관 객체는 원본 객체의 DB 사용"""
+        replicas = {self.router.db_for_read(Product) for _ in range(20)}
+        self.assertEqual(len(replicas), 1)
+
+        product = Product(name="TestProduct")
+        product._state.db = "replica2"
+        self.assertEqual(self.router.db_for_read(Product, instance=product), "replica2")
+
+        # 요청 종료 후 선택 초기화
+        captured = []
+        self._middleware(captured)(self.factory.get("/shop/product/"))
+        self.assertIsNone(db_router._local.replica)
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_router_without_replicas(self):
+        """레플리카가 없으면 읽기도 프라이머리"""
+        self.assertEqual(self.router.db_for_read(Product), "default")
+
+    def test_middleware_write_pins_primary(self):
+        """쓰기 요청은 프라이머리에서 처리되고 고정 쿠키를 발급"""
+        captured = []
+        response = self._middleware(captured)(self.factory.post("/shop/product/"))
+
+        self.assertEqual(captured, ["default"])
+        self.assertIn("pin_primary", response.cookies)
+        self.assertEqual(response.cookies["pin_primary"]["max-age"], 5)
+        self.assertFalse(is_primary_pinned())
+
+    def test_middleware_read_after_write(self):
+        """고정 쿠키가 있는 클라이언트의 읽기는 프라이머리로 라우팅"""
+        captured = []
+        middleware = self._middleware(captured)
+
+        # 쿠키 없는 읽기 요청은 레플리카
+        response = middleware(self.factory.get("/shop/product/"))
+        self.assertNotIn("pin_primary", response.cookies)
+
+        # 쿠키가 있는 읽기 요청은 프라이머리
+        request = self.factory.get("/shop/product/")
+        request.COOKIES["pin_primary"] = "1"
+        middleware(request)
+
+        self.assertIn(captured[0], ["replica1", "replica2"])
+        self.assertEqual(captured[1], "default")
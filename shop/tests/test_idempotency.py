@@ -0,0 +1,149 @@
+import json
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from shop.models import IdempotencyKey, Product
+
+
+class IdempotencyKeyAPITest(TestCase):
+    """Idempotency-Key API 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.client = APIClient()
+        self.url = reverse("product-list")
+        self.request_data = {
+            "name": "TestProduct",
+            "option_set": [{"name": "TestOption", "price": 1000}],
+            "tag_set": [],
+        }
+
+    def _post(self, data, key):
+        return self.client.post(self.url, data, format="json", HTTP_IDEMPOTENCY_KEY=key)
+
+    def test_create_replayed(self):
+        """같은 키로 재시도하면 저장된 응답을 반환하고 상품을 다시 생성하지 않음"""
+        first = self._post(self.request_data, "retry-key")
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+
+        # 재시도는 상품/옵션 테이블에 접근하지 않음
+        with CaptureQueriesContext(connection) as queries:
+            second = self._post(self.request_data, "retry-key")
+        self.assertFalse(
+            any("shop_product" in query["sql"] for query in queries.captured_queries)
+        )
+
+        self.assertEqual(second.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second["Idempotent-Replayed"], "true")
+        self.assertEqual(Product.objects.count(), 1)
+
+    def test_duplicate_replayed_via_unique_constraint(self):
+        """키 선점이 unique 제약에 걸리면 쓰기 없이 먼저 저장된 응답을 받음
+
+        두 요청을 순서대로 보내 동시 요청이 거치는 IntegrityError 경로만 확인함
+        """
+        # 먼저 들어온 요청이 키와 응답을 저장한 상태
+        winner = self._post(self.request_data, "concurrent-key")
+        create = IdempotencyKey.objects.create
+
+        with mock.patch.object(
+            IdempotencyKey.objects, "create", wraps=create
+        ) as reserve, mock.patch("shop.views.Product.objects.create") as product_create:
+            response = self._post(self.request_data, "concurrent-key")
+
+        # 키 선점이 unique 제약으로 실패하고 상품 쓰기는 실행되지 않음
+        reserve.assert_called_once()
+        product_create.assert_not_called()
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data, winner.data)
+        self.assertEqual(response["Idempotent-Replayed"], "true")
+        self.assertEqual(Product.objects.count(), 1)
+
+    def test_key_scoped_by_user(self):
+        """다른 사용자가 같은 키와 본문으로 요청하면 응답을 공유하지 않고 새로 생성"""
+        for username in ("terminal-1", "terminal-2"):
+            self.client.force_authenticate(User.objects.create(username=username))
+            response = self._post(self.request_data, "shared-key")
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            self.assertNotIn("Idempotent-Replayed", response)
+
+        self.assertEqual(Product.objects.count(), 2)
+        self.assertEqual(IdempotencyKey.objects.filter(key="shared-key").count(), 2)
+
+    def test_expired_key_reserved_again(self):
+        """보관 기간이 지난 키는 재전송하지 않고 새 요청으로 처리"""
+        self._post(self.request_data, "expired-key")
+        IdempotencyKey.objects.filter(key="expired-key").update(
+            created_at=timezone.now() - timedelta(days=2)
+        )
+
+        response = self._post({**self.request_data, "name": "Other"}, "expired-key")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotIn("Idempotent-Replayed", response)
+        self.assertEqual(Product.objects.count(), 2)
+        self.assertEqual(
+            IdempotencyKey.objects.get(key="expired-key").response_body,
+            json.dumps(response.data),
+        )
+
+    def test_update_replayed(self):
+        """상품 수정도 같은 키로 재시도하면 저장된 응답 반환"""
+        product = Product.objects.create(name="Original")
+        url = reverse("product-detail", kwargs={"pk": product.pk})
+
+        first = self.client.patch(
+            url, {"name": "Updated"}, format="json", HTTP_IDEMPOTENCY_KEY="patch-key"
+        )
+        Product.objects.filter(pk=product.pk).update(name="Changed")
+        second = self.client.patch(
+            url, {"name": "Updated"}, format="json", HTTP_IDEMPOTENCY_KEY="patch-key"
+        )
+
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(Product.objects.get(pk=product.pk).name, "Changed")
+
+    def test_key_reused_with_different_request(self):
+        """다른 요청에 같은 키를 사용하면 422"""
+        self._post(self.request_data, "reused-key")
+
+        response = self._post({**self.request_data, "name": "Other"}, "reused-key")
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertIn("이미 사용된 Idempotency-Key", response.data["message"])
+        self.assertEqual(Product.objects.count(), 1)
+
+    def test_key_validation(self):
+        """키가 없으면 매번 처리하고, 너무 긴 키는 거부"""
+        self.client.post(self.url, self.request_data, format="json")
+        self.client.post(self.url, self.request_data, format="json")
+        self.assertEqual(Product.objects.count(), 2)
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+        response = self._post(self.request_data, "k" * 256)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("너무 깁니다", response.data["message"])
+
+    def test_cleanup_idempotency_keys_command(self):
+        """보관 기간이 지난 키 삭제 명령 테스트"""
+        self._post(self.request_data, "old-key")
+        self._post(self.request_data, "new-key")
+        IdempotencyKey.objects.filter(key="old-key").update(
+            created_at=timezone.now() - timedelta(days=2)
+        )
+
+        out = StringIO()
+        call_command("cleanup_idempotency_keys", stdout=out)
+        self.assertIn("1개", out.getvalue())
+        self.assertEqual(
+            list(IdempotencyKey.objects.values_list("key", flat=True)), ["new-key"]
+        )
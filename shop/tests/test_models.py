@@ -1,5 +1,13 @@
 from django.test import TestCase
-from shop.models import Tag, Product, ProductOption
+from shop.models import (
+    Tag,
+    Product,
+    ProductOption,
+    ProductSearchToken,
+    IdempotencyKey,
+    ArchivedProduct,
+    ArchivedProductOption,
+)
 
 
 class ModelTest(TestCase):
@@ -20,8 +28,25 @@ class ModelTest(TestCase):
             (self.tag, "TestTag"),
             (self.product, "TestProduct"),
             (self.option, "TestOption"),
+            (ProductSearchToken(product=self.product, token="te", weight=2), "te"),
+            (IdempotencyKey(key="TestKey"), "TestKey"),
+            (ArchivedProduct(name="ArchivedProduct"), "ArchivedProduct"),
+            (ArchivedProductOption(name="ArchivedOption"), "ArchivedOption"),
         ]
 
         for instance, expected_str in test_cases:
             with self.subTest(instance=instance):
                 self.assertEqual(str(instance), expected_str)
+
+    def test_product_queryset_for_api(self):
+        """for_api QuerySet 정렬 및 prefetch 테스트"""
+        self.product.tag_set.add(self.tag)
+        Product.objects.create(name="SecondProduct")
+
+        with self.assertNumQueries(3):
+            products = list(Product.objects.for_api())
+            self.assertEqual(
+                [p.name for p in products], ["TestProduct", "SecondProduct"]
+            )
+            self.assertEqual(list(products[0].option_set.all()), [self.option])
+            self.assertEqual(list(products[0].tag_set.all()), [self.tag])
@@ -0,0 +1,104 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from shop.models import Product
+
+
+class ProfilingTest(TestCase):
+    """요청 프로파일 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.client = APIClient()
+        self.url = reverse("product-list")
+        Product.objects.create(name="TestProduct")
+
+        # 프로파일 저장 경로를 임시 디렉터리로 변경
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        settings_override = override_settings(PROFILING_DIR=self.temp_dir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_profile_requires_staff(self):
+        """관리자가 아니면 X-Profile 헤더를 무시"""
+        response = self.client.get(self.url, HTTP_X_PROFILE="1")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("X-Profile-Id", response)
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_profile_staff_header(self):
+        """관리자 X-Profile 헤더 요청은 프로파일과 SQL 기록을 저장"""
+        staff = User.objects.create_user("admin", password="password", is_staff=True)
+        self.client.force_login(staff)
+
+        response = self.client.get(self.url, HTTP_X_PROFILE="1")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        profile_id = response["X-Profile-Id"]
+        base_path = os.path.join(self.temp_dir.name, profile_id)
+        self.assertTrue(os.path.exists(f"{base_path}.prof"))
+
+        with open(f"{base_path}.json") as f:
+            summary = json.load(f)
+        self.assertEqual(summary["action"], "list")
+        self.assertEqual(summary["status_code"], 200)
+        self.assertEqual(summary["sql_count"], 3)
+        self.assertIn("shop_product", summary["queries"][0]["sql"])
+
+    @override_settings(PROFILING_SAMPLE_RATE=1.0)
+    def test_profile_sampled(self):
+        """샘플링 비율에 따라 일반 요청도 프로파일"""
+        response = self.client.get(self.url)
+        self.assertIn("X-Profile-Id", response)
+
+    @override_settings(PROFILING_SAMPLE_RATE=1.0, PROFILING_MAX_CAPTURES=2)
+    def test_profile_retention(self):
+        """보관 개수를 넘으면 오래된 프로파일부터 삭제"""
+        profile_ids = [self.client.get(self.url)["X-Profile-Id"] for _ in range(3)]
+
+        # 가장 먼저 생성된 프로파일(.json, .prof)만 삭제
+        files = os.listdir(self.temp_dir.name)
+        self.assertEqual(len(files), 4)
+        self.assertEqual(
+            {name.rsplit(".", 1)[0] for name in files}, set(profile_ids[1:])
+        )
+
+    @override_settings(PROFILING_SAMPLE_RATE=1.0)
+    def test_profiles_command(self):
+        """프로파일 목록 및 요약 명령 테스트"""
+        out = StringIO()
+        call_command("profiles", stdout=out)
+        self.assertIn("저장된 프로파일이 없습니다", out.getvalue())
+
+        profile_id = self.client.get(self.url)["X-Profile-Id"]
+
+        # 목록
+        out = StringIO()
+        call_command("profiles", stdout=out)
+        self.assertIn(profile_id, out.getvalue())
+        self.assertIn("SQL 3건", out.getvalue())
+
+        # 요약
+        out = StringIO()
+        call_command("profiles", profile_id, top=5, stdout=out)
+        self.assertIn("(list)", out.getvalue())
+        self.assertIn("shop_product", out.getvalue())
+        self.assertRegex(
+            out.getvalue(), r"\n +\d+ function calls .*in [\d.]+ seconds\n"
+        )
+        self.assertRegex(
+            out.getvalue(), r"\n +ncalls +tottime +percall +cumtime +percall "
+        )
+
+        # 존재하지 않는 프로파일
+        with self.assertRaises(CommandError):
+            call_command("profiles", "missing")
@@ -0,0 +1,135 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from shop.models import Product, ProductOption, ProductSearchToken
+from shop.search import search_products, tokenize
+
+
+class ProductSearchAPITest(TestCase):
+    """상품 검색 API 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.client = APIClient()
+        self.url = reverse("product-search")
+        self.list_url = reverse("product-list")
+
+    def _create(self, name, option_names=(), tag_names=()):
+        """API로 상품 생성"""
+        request_data = {
+            "name": name,
+            "option_set": [{"name": option, "price": 1000} for option in option_names],
+            "tag_set": [{"name": tag} for tag in tag_names],
+        }
+        return self.client.post(self.list_url, request_data, format="json").data
+
+    def test_tokenize(self):
+        """1-gram, 2-gram 토큰 생성 테스트"""
+        self.assertEqual(
+            tokenize("사과 주스"), {"사", "과", "사과", "주", "스", "주스"}
+        )
+        self.assertEqual(tokenize("AB"), {"a", "b", "ab"})
+
+    def test_search_ranked_with_tags(self):
+        """상품명 일치가 옵션명 일치보다 우선하고 태그를 포함"""
+        option_match = self._create("음료 세트", option_names=["사과주스"])
+        name_match = self._create("사과주스", tag_names=["과일"])
+        self._create("포도주스")
+
+        response = self.client.get(self.url, {"q": "사과주"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["pk"] for item in response.data],
+            [name_match["pk"], option_match["pk"]],
+        )
+        self.assertEqual(response.data[0]["tag_set"][0]["name"], "과일")
+
+        # 한 글자 검색
+        response = self.client.get(self.url, {"q": "포"})
+        self.assertEqual([item["name"] for item in response.data], ["포도주스"])
+
+    @override_settings(PRODUCT_SEARCH_CANDIDATE_LIMIT=1)
+    def test_search_capped_tokens_tie_break(self):
+        """두 토큰 모두 후보 한도에 걸리면 긴 토큰을 기준으로 후보 선택"""
+        self._create("커피콩")
+        match = self._create("커피 가")
+        self._create("가다")
+
+        # "커피" 후보(가장 최근 상품 "커피 가")에서 검색 → "가" 후보("가다")였다면 결과 없음
+        response = self.client.get(self.url, {"q": "커피 가"})
+        self.assertEqual([item["pk"] for item in response.data], [match["pk"]])
+
+    def test_search_synced_on_update(self):
+        """상품 수정 시 검색 색인 갱신"""
+        product = self._create("김치찌개", option_names=["1인분"])
+        url = reverse("product-detail", kwargs={"pk": product["pk"]})
+
+        # 상품명 수정
+        self.client.patch(url, {"name": "된장찌개"}, format="json")
+        self.assertEqual(len(self.client.get(self.url, {"q": "김치"}).data), 0)
+        self.assertEqual(len(self.client.get(self.url, {"q": "된장"}).data), 1)
+
+        # 옵션명만 수정해도 상품명 색인 유지
+        self.client.patch(
+            url, {"option_set": [{"name": "2인분", "price": 1}]}, format="json"
+        )
+        self.assertEqual(len(self.client.get(self.url, {"q": "1인분"}).data), 0)
+        self.assertEqual(len(self.client.get(self.url, {"q": "2인분"}).data), 1)
+        self.assertEqual(len(self.client.get(self.url, {"q": "된장"}).data), 1)
+
+    def test_search_validation(self):
+        """검색어 누락 테스트"""
+        response = self.client.get(self.url, {"q": "  "})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("검색어가 필요합니다", response.data["message"])
+
+        # 최대 길이 초과
+        response = self.client.get(self.url, {"q": "가" * 51})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("최대 50자", response.data["message"])
+
+        # 토큰이 없는 검색어, 색인에 없는 토큰이 있는 검색어는 빈 결과
+        self.assertEqual(search_products(""), [])
+        self._create("사과주스")
+        self.assertEqual(search_products("사과 없는토큰"), [])
+
+        # 색인이 없는 토큰을 만나면 나머지 토큰은 세지 않음
+        with self.assertNumQueries(1):
+            self.assertEqual(search_products("가가 사과"), [])
+
+    @override_settings(PRODUCT_SEARCH_CANDIDATE_LIMIT=2)
+    def test_search_candidate_limit(self):
+        """가장 드문 토큰의 후보만 가중치 순으로 확인"""
+        option_match = self._create("세트", option_names=["스낵"])
+        first = self._create("스낵 A")
+        second = self._create("스낵 B")
+
+        # 후보 2개 (상품명 일치 우선) 중에서만 결과 반환
+        response = self.client.get(self.url, {"q": "스"})
+        self.assertEqual(
+            [item["pk"] for item in response.data], [first["pk"], second["pk"]]
+        )
+
+        # 드문 토큰이 있으면 흔한 토큰과 관계없이 검색
+        response = self.client.get(self.url, {"q": "세트 스낵"})
+        self.assertEqual([item["pk"] for item in response.data], [option_match["pk"]])
+
+    def test_rebuild_search_index_command(self):
+        """기존 상품 검색 색인 재생성 명령 테스트"""
+        product = Product.objects.create(name="떡볶이")
+        ProductOption.objects.create(product=product, name="매운맛", price=3000)
+        Product.objects.create(name="순대")
+        self.assertFalse(ProductSearchToken.objects.exists())
+
+        # 레플리카가 설정되어도 프라이머리에서 읽음 (레플리카로 라우팅되면 연결 오류)
+        out = StringIO()
+        with self.settings(DATABASE_REPLICAS=["replica1"]):
+            call_command("rebuild_search_index", batch_size=1, stdout=out)
+        self.assertIn("2개 상품", out.getvalue())
+
+        response = self.client.get(self.url, {"q": "매운"})
+        self.assertEqual([item["name"] for item in response.data], ["떡볶이"])
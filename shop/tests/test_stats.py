@@ -0,0 +1,172 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from shop.models import Tag, Product, ProductOption
+from shop import stats
+from shop.stats import (
+    get_product_stats,
+    invalidate_product_stats,
+    product_stats_cache_key,
+)
+
+
+class ProductStatsFixtureMixin:
+    """상품 통계 테스트 데이터"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse("product-stats")
+
+        self.tag = Tag.objects.create(name="Popular")
+        self.empty_tag = Tag.objects.create(name="Empty")
+
+        self.product = Product.objects.create(name="Product1")
+        ProductOption.objects.create(product=self.product, name="Small", price=5000)
+        ProductOption.objects.create(product=self.product, name="Large", price=15000)
+        self.product.tag_set.add(self.tag)
+
+        Product.objects.create(name="NoOption")
+
+
+class ProductStatsAPITest(ProductStatsFixtureMixin, TestCase):
+    """상품 통계 API 테스트"""
+
+    def test_stats_rollups(self):
+        """태그별 상품 수, 가격 분포, 옵션 개수 분포 집계 테스트"""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.data
+        self.assertEqual(data["product_count"], 2)
+        self.assertEqual(data["option_count"], 2)
+        self.assertEqual(
+            data["tag_product_counts"],
+            [
+                {"id": self.tag.pk, "name": "Popular", "product_count": 1},
+                {"id": self.empty_tag.pk, "name": "Empty", "product_count": 0},
+            ],
+        )
+
+        self.assertEqual(data["price"]["min"], 5000)
+        self.assertEqual(data["price"]["max"], 15000)
+        self.assertEqual(data["price"]["avg"], 10000)
+        self.assertEqual(
+            data["price"]["buckets"],
+            [
+                {"min_price": 0, "max_price": 9999, "option_count": 1},
+                {"min_price": 10000, "max_price": 19999, "option_count": 1},
+            ],
+        )
+        self.assertEqual(
+            data["option_count_histogram"],
+            [
+                {"option_count": 0, "product_count": 1},
+                {"option_count": 2, "product_count": 1},
+            ],
+        )
+
+    def test_stats_exclude_archived(self):
+        """보관된 상품과 옵션은 통계에서 제외"""
+        archived = Product.objects.create(name="Archived", is_active=False)
+        ProductOption.objects.create(product=archived, name="Old", price=50000)
+        archived.tag_set.add(self.tag)
+
+        data = self.client.get(self.url).data
+        self.assertEqual(data["product_count"], 2)
+        self.assertEqual(data["option_count"], 2)
+        self.assertEqual(data["tag_product_counts"][0]["product_count"], 1)
+        self.assertEqual(data["price"]["max"], 15000)
+        self.assertEqual(len(data["price"]["buckets"]), 2)
+        self.assertEqual(
+            sum(row["product_count"] for row in data["option_count_histogram"]), 2
+        )
+
+    def test_stale_compute_not_cached_for_new_generation(self):
+        """집계 도중 쓰기가 커밋되면 늦게 저장된 이전 통계는 새 세대에서 보이지 않음"""
+        compute = stats._compute_product_stats
+
+        def compute_then_write():
+            result = compute()
+            Product.objects.create(name="Concurrent")
+            invalidate_product_stats()
+            return result
+
+        with mock.patch(
+            "shop.stats._compute_product_stats", side_effect=compute_then_write
+        ):
+            self.assertEqual(get_product_stats()["product_count"], 2)
+
+        self.assertEqual(self.client.get(self.url).data["product_count"], 3)
+
+    def test_invalidate_without_generation(self):
+        """세대 키가 없을 때 무효화하면 새 세대로 시작"""
+        get_product_stats()
+        cache.delete(stats.PRODUCT_STATS_GENERATION_KEY)
+
+        invalidate_product_stats()
+        self.assertEqual(
+            product_stats_cache_key(), f"{stats.PRODUCT_STATS_CACHE_KEY}:1"
+        )
+        self.assertIsNone(cache.get(product_stats_cache_key()))
+
+    @override_settings(DATABASE_REPLICAS=["replica1"])
+    def test_stats_computed_on_primary(self):
+        """레플리카가 설정되어도 통계는 프라이머리에서 집계"""
+        # 존재하지 않는 레플리카로 라우팅되면 ConnectionDoesNotExist 발생
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["product_count"], 2)
+
+
+class ProductStatsInvalidationTest(ProductStatsFixtureMixin, TransactionTestCase):
+    """상품 통계 캐시 무효화 테스트 (커밋 시점 무효화를 확인하기 위해 실제 커밋 사용)"""
+
+    def test_stats_cached_until_write(self):
+        """통계는 캐시되고 상품 생성/수정 시 무효화"""
+        self.client.get(self.url)
+
+        # 캐시된 통계는 쿼리 없이 응답
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data["product_count"], 2)
+
+        # 상품 생성 후 통계 갱신
+        request_data = {"name": "NewProduct", "option_set": [], "tag_set": []}
+        self.client.post(reverse("product-list"), request_data, format="json")
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["product_count"], 3)
+
+        # Idempotency-Key 요청도 커밋 이후 통계 갱신
+        request_data = {"name": "KeyProduct", "option_set": [], "tag_set": []}
+        self.client.post(
+            reverse("product-list"),
+            request_data,
+            format="json",
+            HTTP_IDEMPOTENCY_KEY="stats-key",
+        )
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["product_count"], 4)
+
+        # 상품 수정 후 통계 갱신
+        url = reverse("product-detail", kwargs={"pk": self.product.pk})
+        self.client.patch(url, {"tag_set": []}, format="json")
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["tag_product_counts"][0]["product_count"], 0)
+
+    def test_stats_invalidated_after_commit(self):
+        """바깥 트랜잭션이 커밋되기 전에는 통계 캐시를 지우지 않음"""
+        self.client.get(self.url)
+
+        request_data = {"name": "NewProduct", "option_set": [], "tag_set": []}
+        with transaction.atomic():
+            self.client.post(reverse("product-list"), request_data, format="json")
+            self.assertIsNotNone(cache.get(product_stats_cache_key()))
+
+        self.assertIsNone(cache.get(product_stats_cache_key()))
@@ -1,38 +1,119 @@
+from itertools import islice
+
+from django.conf import settings
 from django.db import transaction, IntegrityError
+from django.db.models import prefetch_related_objects
+from django.utils import timezone
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from shop.idempotency import idempotent
 from shop.models import Product, ProductOption, Tag
+from shop.profiling import ProfilingMixin
 from shop.serializers import ProductCreateSerializer
+from shop.search import index_product, search_products
+from shop.stats import get_product_stats, invalidate_product_stats
+
+# DB 정수 pk 최대값 (64비트)
+MAX_PK = 2**63 - 1
+
+
+def _set_prefetched(product, name, objs):
+    """쓰기 후 메모리 객체로 prefetch 캐시를 채워 재조회를 생략
+
+    Django 2.2 prefetch_one_level()이 캐시를 채우는 방식을 그대로 따름
+    (QuerySet._result_cache, _prefetch_done 은 비공개 API이므로 업그레이드 시 확인 필요)
+    """
+    queryset = getattr(product, name).all()
+    unique_objs = {obj.pk: obj for obj in objs}.values()
+    queryset._result_cache = sorted(unique_objs, key=lambda obj: obj.pk)
+    queryset._prefetch_done = True
+
+    if not hasattr(product, "_prefetched_objects_cache"):
+        product._prefetched_objects_cache = {}
+    product._prefetched_objects_cache[name] = queryset
+
+
+def _parse_pk(value):
+    """양의 64비트 정수 pk 파싱 (ASCII 숫자만 허용, 범위를 벗어나면 ValueError)"""
+    if not (value.isascii() and value.isdigit()) or len(value) > len(str(MAX_PK)):
+        raise ValueError(value[:20])
+    pk = int(value)
+    if not 0 < pk <= MAX_PK:
+        raise ValueError(value)
+    return pk
 
 
-class ProductViewSet(viewsets.ModelViewSet):
+class ProductViewSet(ProfilingMixin, viewsets.ModelViewSet):
 
-    queryset = Product.objects.all()
+    queryset = Product.objects.active().for_api()
     serializer_class = ProductCreateSerializer
     http_method_names = ["get", "post", "patch"]
 
+    # 조회 대상 상품 (기본은 판매 중인 상품만, include_archived=true 이면 전체)
+    def _products(self, request):
+        products = Product.objects.all()
+        if request.query_params.get("include_archived") not in ("1", "true"):
+            products = products.active()
+        return products.for_api()
+
     # 상품 목록 조회 API
     def list(self, request, *args, **kwargs):
+        # ids 파라미터가 있으면 여러 상품 일괄 조회
+        if "ids" in request.query_params:
+            return self._batch_retrieve(request)
+
         # 데이터 호출
-        products = (
-            Product.objects.prefetch_related("option_set", "tag_set")
-            .all()
-        )
+        products = self._products(request)
 
         # 응답 데이터 생성
         serializer = ProductCreateSerializer(products, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    # 상품 일괄 조회 (요청 순서 유지, 상품 수와 무관하게 3회 쿼리)
+    def _batch_retrieve(self, request):
+        # 조회 개수 검증 (전체 문자열을 파싱하기 전에 개수부터 확인)
+        # (공백/빈 항목은 제외하고 최대 limit + 1 개까지만 확인)
+        limit = settings.PRODUCT_BATCH_GET_LIMIT
+        pieces = (pk.strip() for pk in request.query_params["ids"].split(","))
+        raw_ids = list(islice((pk for pk in pieces if pk), limit + 1))
+        if len(raw_ids) > limit:
+            return Response(
+                {"message": f"한 번에 최대 {limit}개 상품까지 조회할 수 있습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            # 중복 제거 후 요청 순서 유지
+            ids = list(dict.fromkeys(_parse_pk(pk) for pk in raw_ids))
+        except ValueError as e:
+            return Response(
+                {"message": f"잘못된 데이터 형식입니다: {str(e)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # 데이터 호출
+        products = self._products(request).in_bulk(ids)
+
+        # 응답 데이터 생성
+        serializer = ProductCreateSerializer(
+            [products[pk] for pk in ids if pk in products], many=True
+        )
+        return Response(
+            {
+                "results": serializer.data,
+                "missing_ids": [pk for pk in ids if pk not in products],
+            },
+            status=status.HTTP_200_OK,
+        )
+
     # 상품 단일 조회 API
     def retrieve(self, request, *args, **kwargs):
         try:
             # 데이터 호출
             pk = kwargs.get("pk")
-            product = (
-                Product.objects.prefetch_related("option_set", "tag_set")
-                .get(pk=pk)
-            )
+            product = self._products(request).get(pk=pk)
 
             # 응답 데이터 생성
             serializer = ProductCreateSerializer(product)
@@ -44,7 +125,37 @@ class ProductViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
+    # 상품 통계 조회 API
+    @action(detail=False, methods=["get"])
+    def stats(self, request, *args, **kwargs):
+        return Response(get_product_stats(), status=status.HTTP_200_OK)
+
+    # 상품 검색 API
+    @action(detail=False, methods=["get"])
+    def search(self, request, *args, **kwargs):
+        query = request.query_params.get("q", "").strip()
+
+        # 검색어 검증
+        if not query:
+            return Response(
+                {"message": "검색어가 필요합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # 검색어 길이 검증 (토큰마다 색인 조회가 실행되므로 길이 제한)
+        max_length = settings.PRODUCT_SEARCH_MAX_QUERY_LENGTH
+        if len(query) > max_length:
+            return Response(
+                {"message": f"검색어는 최대 {max_length}자까지 입력할 수 있습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # 응답 데이터 생성
+        serializer = ProductCreateSerializer(search_products(query), many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
     # 상품 생성 API
+    @idempotent
     def create(self, request, *args, **kwargs):
         try:
             name = request.data.get("name")
@@ -64,22 +175,37 @@ class ProductViewSet(viewsets.ModelViewSet):
                 product = Product.objects.create(name=name)
 
                 # 옵션 생성
-                for option_data in option_set:
+                options = [
                     ProductOption.objects.create(
                         product=product,
                         name=option_data["name"],
                         price=option_data["price"],
                     )
+                    for option_data in option_set
+                ]
 
                 # 태그 처리
+                tags = []
                 for tag_data in tag_set:
                     if "pk" in tag_data:
-                        tag = Tag.objects.get(pk=tag_data["pk"])
+                        tag = Tag.objects.only("id", "name").get(pk=tag_data["pk"])
                     else:
                         tag = Tag.objects.create(name=tag_data["name"])
-                    product.tag_set.add(tag)
+                    tags.append(tag)
+                if tags:
+                    product.tag_set.add(*tags)
+
+                # 검색 색인 생성
+                index_product(product, [option.name for option in options])
 
-            # 응답 데이터 생성 (N+1 문제 해결 불필요 - 이미 생성된 객체 사용)
+            # 통계 캐시 무효화 (바깥 트랜잭션이 있으면 커밋 이후)
+            transaction.on_commit(invalidate_product_stats)
+
+            # 생성된 메모리 객체를 그대로 응답에 사용 (재조회 없음)
+            _set_prefetched(product, "option_set", options)
+            _set_prefetched(product, "tag_set", tags)
+
+            # 응답 데이터 생성
             serializer = ProductCreateSerializer(product)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
 
@@ -105,30 +231,50 @@ class ProductViewSet(viewsets.ModelViewSet):
             )
 
     # 상품 수정 API
+    @idempotent
     def update(self, request, *args, **kwargs):
         try:
             pk = kwargs.get("pk")
-            product = Product.objects.get(pk=pk)
+            product = Product.objects.only("id", "name", "is_active").get(pk=pk)
 
             # 트랜잭션으로 데이터 수정
             with transaction.atomic():
+                update_fields = []
+
                 # 상품명 부분 수정 (요청에 있을 때만)
                 if "name" in request.data:
                     product.name = request.data["name"]
-                    product.save()
+                    update_fields.append("name")
+
+                # 판매 여부 수정 (False 이면 보관 처리)
+                if "is_active" in request.data:
+                    if not isinstance(request.data["is_active"], bool):
+                        raise ValueError("is_active")
+                    # 판매 여부가 바뀔 때만 보관일시 갱신 (이미 보관된 상품은 유지)
+                    if request.data["is_active"] != product.is_active:
+                        product.is_active = request.data["is_active"]
+                        product.archived_at = (
+                            None if product.is_active else timezone.now()
+                        )
+                        update_fields.extend(["is_active", "archived_at"])
+
+                if update_fields:
+                    product.save(update_fields=update_fields)
 
                 # 옵션 부분 수정 (요청에 있을 때만)
                 if "option_set" in request.data:
                     # 기존 옵션 모두 제거
-                    product.option_set.all().delete()
+                    ProductOption.objects.filter(product=product).delete()
 
                     # 새로운 옵션 생성
-                    for option_data in request.data["option_set"]:
+                    options = [
                         ProductOption.objects.create(
                             product=product,
                             name=option_data["name"],
                             price=option_data["price"],
                         )
+                        for option_data in request.data["option_set"]
+                    ]
 
                 # 태그 부분 수정 (요청에 있을 때만)
                 if "tag_set" in request.data:
@@ -136,18 +282,38 @@ class ProductViewSet(viewsets.ModelViewSet):
                     product.tag_set.clear()
 
                     # 새로운 태그 처리
+                    tags = []
                     for tag_data in request.data["tag_set"]:
                         if "pk" in tag_data:
-                            tag = Tag.objects.get(pk=tag_data["pk"])
+                            tag = Tag.objects.only("id", "name").get(pk=tag_data["pk"])
                         else:
                             tag = Tag.objects.create(name=tag_data["name"])
-                        product.tag_set.add(tag)
+                        tags.append(tag)
+                    if tags:
+                        product.tag_set.add(*tags)
 
-            # N+1 문제 해결
-            product = (
-                Product.objects.prefetch_related("option_set", "tag_set")
-                .get(pk=product.pk)
-            )
+                # 수정된 연관 객체는 메모리 객체를 재사용하고, 나머지만 조회
+                if "option_set" in request.data:
+                    _set_prefetched(product, "option_set", options)
+                if "tag_set" in request.data:
+                    _set_prefetched(product, "tag_set", tags)
+                prefetch_related_objects(
+                    [product],
+                    *[
+                        lookup
+                        for lookup in Product.objects.api_prefetches()
+                        if lookup.prefetch_to not in request.data
+                    ],
+                )
+
+                # 검색 색인 갱신 (상품명/옵션명/판매 여부가 바뀐 경우만)
+                if {"name", "option_set", "is_active"} & set(request.data):
+                    index_product(
+                        product, [option.name for option in product.option_set.all()]
+                    )
+
+            # 통계 캐시 무효화 (바깥 트랜잭션이 있으면 커밋 이후)
+            transaction.on_commit(invalidate_product_stats)
 
             # 응답 데이터 생성
             serializer = ProductCreateSerializer(product)